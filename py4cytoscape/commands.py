@@ -36,11 +36,24 @@ import webbrowser
 import sys
 import os
 
+# orjson encodes large request bodies and decodes large replies much faster than the standard json module, but it's
+# optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Internal module convenience imports
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, log_http_result, log_http_request
 from .exceptions import CyError
 
+# One HTTP session shared by all CyREST and Commands API calls, so consecutive calls reuse a kept-alive connection
+# instead of each opening its own. (HTTP/2 wouldn't add much: calls are made one at a time, so there's nothing to
+# multiplex, and CyREST is plain HTTP on localhost, so there's no TLS handshake to save.)
+_SESSION = requests.Session()
+_SESSION.headers.update({'Connection': 'keep-alive'})
+
 
 def __init__(self):
     pass
@@ -148,7 +161,7 @@ def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, requi
         r = _do_request('GET', url, params=parameters)
         r.raise_for_status()
         try:
-            return r.json()
+            return _response_json(r)
         except ValueError as e:
             if require_json:
                 raise
@@ -665,10 +678,32 @@ def prep_post_query_lists(cmd_list=None, cmd_by_col=None):
 
 def _do_request(method, url, **kwargs):
     log_http_request(method, url, **kwargs)
-    r = requests.request(method, url, **kwargs)
+    r = _SESSION.request(method, url, **_encode_json_body(kwargs))
     log_http_result(r)
     return r
 
+def _encode_json_body(kwargs):
+    # Use orjson to encode a JSON body if it's available. Bodies it can't encode (e.g., dicts with non-string keys) are
+    # left for requests to encode with the json module.
+    body = kwargs.get('json')
+    if orjson is None or body is None: return kwargs
+    try:
+        data = orjson.dumps(body)
+    except orjson.JSONEncodeError:
+        return kwargs
+    headers = dict(kwargs.get('headers') or {}, **{'Content-Type': 'application/json'})
+    return dict(kwargs, json=None, data=data, headers=headers)
+
+def _response_json(r):
+    # Use orjson if it's available. It's stricter than the json module (e.g., it rejects NaN), so let the json module
+    # have the final say on anything orjson can't decode.
+    if orjson is not None:
+        try:
+            return orjson.loads(r.content)
+        except orjson.JSONDecodeError:
+            pass
+    return r.json()
+
 def _handle_error(caller, e, force_cy_error=False):
     if e.response is None or e.response.text is None or e.response.text == '':
         print('In ' + caller + ': ' + str(e))
@@ -21,5 +21,6 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 CATCHUP_FILTER_SECS = 4
 MODEL_PROPAGATION_SECS = 10
+MODEL_PROPAGATION_POLL_SECS = 0.05
 CATCHUP_NETWORK_SECS = 4
 NDEX_DELAY_SECS = 10
@@ -28,6 +28,7 @@ import sys
 
 # Internal module imports
 from . import tables
+from . import networks
 from . import cytoscape_system
 
 # Internal module convenience imports
@@ -61,6 +62,21 @@ def is_not_hex_color(color):
         sys.stderr.write('Error. ' + color + ' is not a valid hexadecimal color (has to begin with # and be 7 characters long).')
         return True
 
+# Concatenated hex color codes, each of which is '#' followed by six characters (the same rule as is_not_hex_color())
+_HEX_COLORS_RE = re.compile(r'(?:#.{6})*', re.DOTALL)
+
+# Validate a list of hex color codes, reporting the first bad one. Well-formed lists (the usual case) are checked by
+# one match of a precompiled regex over the concatenated codes instead of once per color; anything else falls back to
+# is_not_hex_color() so the user sees the same message.
+def is_not_hex_colors(colors):
+    if not colors: return False
+    try:
+        if set(map(len, colors)) == {7} and _HEX_COLORS_RE.fullmatch(''.join(colors)):
+            return False
+    except TypeError:
+        pass
+    return any(is_not_hex_color(color) for color in colors)
+
 def node_name_to_node_suid(node_names, network=None, base_url=DEFAULT_BASE_URL):
     if node_names is None: return None
     # TODO: Should this be a simple conversion, or a split(',')??
@@ -143,10 +159,14 @@ def edge_suid_to_edge_name(edge_suids, network=None, base_url=DEFAULT_BASE_URL):
 
 # ------------------------------------------------------------------------------
 # Checks to see if a particular column name exists in the specific table. Returns
-# TRUE or FALSE.
+# TRUE or FALSE. Column names come from the column cache in tables, which is refreshed
+# before a column is reported missing, so checking the same table again costs no CyREST call.
 # TODO: R had netowrk=network, which looks like a typo
 def table_column_exists(table_column, table, network=None, base_url=DEFAULT_BASE_URL):
-    if table_column not in tables.get_table_column_names(table, network=network, base_url=base_url):
+    suid = networks.get_network_suid(network, base_url=base_url)
+    table_name = 'default' + table
+    if table_column not in tables.cached_column_types(suid, table_name, base_url=base_url) and \
+            table_column not in tables.cached_column_types(suid, table_name, base_url=base_url, refresh=True):
         sys.stderr.write('Column ' + table_column + ' does not exist in the ' + table + ' table.')
         # TODO: Is this a good idea ... writing the error out?
         return False
@@ -25,6 +25,8 @@ import os
 
 # Internal module imports
 from . import commands
+from . import tables
+from . import style_mappings
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
@@ -67,6 +69,8 @@ def close_session(save_before_closing, filename=None, base_url=DEFAULT_BASE_URL)
     """
     if save_before_closing: save_session(filename, base_url=base_url)
 
+    tables.invalidate_column_types_cache()
+    style_mappings.invalidate_style_mappings_cache()
     return commands.commands_post('session new', base_url=base_url)
 
 
@@ -110,6 +114,8 @@ def open_session(file_location=None, base_url=DEFAULT_BASE_URL):
         file_location = os.path.abspath(file_location)
 
     sys.stderr.write('Opening ' + file_location + '...')
+    tables.invalidate_column_types_cache()
+    style_mappings.invalidate_style_mappings_cache()
     return commands.commands_post('session open ' + type + '="' + file_location + '"', base_url=base_url)
 
 
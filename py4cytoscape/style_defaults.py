@@ -155,6 +155,42 @@ def set_visual_property_default(style_string, style_name='default', base_url=DEF
     return res
 
 
+@cy_log
+def set_visual_property_defaults(style_strings, style_name='default', base_url=DEFAULT_BASE_URL):
+    """Set the default values for several visual properties.
+
+    Same as calling ``set_visual_property_default()`` for each property, except that all defaults are sent in a single
+    request, and waiting for Cytoscape to apply them happens once.
+
+    Args:
+        style_strings (list): The names and values for the properties as dicts, e.g., [{'visualProperty': 'NODE_SIZE', 'value': '35'}, {'visualProperty': 'NODE_SHAPE', 'value': 'OCTAGON'}]
+        style_name (str): Name of style; default is "default" style
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        str: ''
+
+    Raises:
+        CyError: if property or style name doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> set_visual_property_defaults([{'visualProperty': 'EDGE_UNSELECTED_PAINT', 'value': '#CCCCCC'}, {'visualProperty': 'EDGE_WIDTH', 'value': '5.0'}], style_name='galFiltered Style')
+        ''
+
+    See Also:
+        :meth:`set_visual_property_default`
+    """
+    if not style_strings: return ''
+    res = commands.cyrest_put('styles/' + style_name + '/defaults', body=style_strings, base_url=base_url,
+                              require_json=False)
+    time.sleep(
+        MODEL_PROPAGATION_SECS)  # wait for attributes to be applied ... it looks like Cytoscape returns before this is complete [BUG]
+    return res
+
+
 # ==============================================================================
 # II. Specific Functions
 # ==============================================================================
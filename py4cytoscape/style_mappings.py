@@ -25,10 +25,14 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 # External library imports
 import sys
 import time
+import copy
+import re
+import numpy as np
 
 # Internal module imports
 from . import networks
 from . import commands
+from . import tables
 from . import styles
 from . import style_defaults
 from . import style_dependencies
@@ -37,8 +41,32 @@ from . import style_dependencies
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
-from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS
+from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS, MODEL_PROPAGATION_POLL_SECS
 
+# Runs of white space in a visual property name, which are converted to '_' (e.g., 'node fill color')
+_WS_RE = re.compile(r'\s+')
+
+# Full names of abbreviated mapping types, and canonical names of common alternative visual property names
+_MAPPING_TYPES = {'c': 'continuous', 'd': 'discrete', 'p': 'passthrough'}
+_PROPERTY_NAMES = {'EDGE_COLOR': 'EDGE_UNSELECTED_PAINT', 'EDGE_THICKNESS': 'EDGE_WIDTH',
+                   'NODE_BORDER_COLOR': 'NODE_BORDER_PAINT', 'NODE_BORDER_LINE_TYPE': 'NODE_BORDER_STROKE'}
+
+# Abbreviations of the mapping types accepted by the specific (set_*_mapping) functions
+_MAPPING_ALIASES = {'continuous': 'c', 'c': 'c', 'interpolate': 'c', 'discrete': 'd', 'd': 'd', 'lookup': 'd',
+                    'passthrough': 'p', 'p': 'p'}
+
+# Visual property names known to each Cytoscape instance, as {base_url: {visual property name, ...}}. The list is fixed
+# for the life of a Cytoscape instance, so it's fetched once instead of once per mapping.
+_VP_NAMES_CACHE = {}
+
+# Table holding the columns that can be mapped to a visual property, keyed by the first four letters of the visual
+# property name (NODE_, EDGE_ or NETWORK_)
+_VP_PREFIX_TO_TABLE = {'NODE': 'defaultnode', 'EDGE': 'defaultedge', 'NETW': 'defaultnetwork'}
+
+# Mappings in each style, as {(base_url, style name): {visual property name: mapping}}. Functions that change a style's
+# mappings, and functions that create, copy or delete a style, drop that style's entry. Importing styles and opening or
+# closing a session drop all entries.
+_STYLE_MAPPINGS_CACHE = {}
 
 # ==============================================================================
 # I. General Functions
@@ -98,65 +126,48 @@ def map_visual_property(visual_prop, table_column, mapping_type, table_column_va
     See Also:
         :meth:`update_style_mapping`, :meth:`get_visual_property_names`
     """
-    MAPPING_TYPES = {'c': 'continuous', 'd': 'discrete', 'p': 'passthrough'}
-    PROPERTY_NAMES = {'EDGE_COLOR': 'EDGE_UNSELECTED_PAINT', 'EDGE_THICKNESS': 'EDGE_WIDTH',
-                      'NODE_BORDER_COLOR': 'NODE_BORDER_PAINT', 'NODE_BORDER_LINE_TYPE': 'NODE_BORDER_STROKE'}
-
+    _check_mapping_values(mapping_type, table_column_values, visual_prop_values)
     suid = networks.get_network_suid(network, base_url=base_url)
+    return _build_visual_prop_map(visual_prop, table_column, mapping_type, table_column_values, visual_prop_values,
+                                  suid=suid, base_url=base_url)
 
-    # process mapping type
-    mapping_type_name = MAPPING_TYPES[mapping_type] if mapping_type in MAPPING_TYPES else mapping_type
 
-    # process visual property, including common alternatives for vp names :)
-    visual_prop_name = re.sub('\\s+', '_', visual_prop).upper()
-    if visual_prop_name in PROPERTY_NAMES: visual_prop_name = PROPERTY_NAMES[visual_prop_name]
+@cy_log
+def map_visual_properties_bulk(specs, network=None, base_url=DEFAULT_BASE_URL):
+    """Create several mappings between attributes and visual properties.
 
-    # check visual prop name
-    if visual_prop_name not in styles.get_visual_property_names(base_url=base_url):
-        raise CyError(
-            'Could not find ' + visual_prop_name + '. Run get_visual_property_names() to retrieve property names.')
+    Generates the same data structures as calling ``map_visual_property()`` once per spec, but resolves the network
+    once and shares the visual property name and table column lookups across all specs, which saves a round trip to
+    Cytoscape per spec.
 
-    # check mapping column and get type
-    tp = visual_prop_name.split('_')[0].lower()
-    table = 'default' + tp
-    res = commands.cyrest_get('networks/' + str(suid) + '/tables/' + table + '/columns', base_url=base_url)
-    table_column_type = None
-    for col in res:
-        if col['name'] == table_column:
-            table_column_type = col['type']
-            break
-    if table_column_type is None:
-        raise CyError('Could not find ' + table_column + ' column in ' + table + ' table.')
+    Args:
+        specs (list): list of tuples, each holding the ``visual_prop``, ``table_column``, ``mapping_type``,
+            ``table_column_values`` and ``visual_prop_values`` parameters of ``map_visual_property()``; the last two
+            can be omitted for passthrough mappings
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
 
-    # construct visual property map
-    visual_prop_map = {'mappingType': mapping_type_name, 'mappingColumn': table_column,
-                       'mappingColumnType': table_column_type, 'visualProperty': visual_prop_name}
-    if mapping_type_name == 'discrete':
-        visual_prop_map['map'] = [{'key': col_val, 'value': prop_val} for col_val, prop_val in
-                                  zip(table_column_values, visual_prop_values)]
-    elif mapping_type_name == 'continuous':
-        # check for extra lesser and greater values
-        prop_val_count = len(visual_prop_values)
-        col_val_count = len(table_column_values)
-        if prop_val_count - col_val_count == 2:
-            matched_visual_prop_values = visual_prop_values[1:]
-            points = [{'value': col_val, 'lesser': prop_val, 'equal': prop_val, 'greater': prop_val} for
-                      col_val, prop_val in zip(table_column_values, matched_visual_prop_values)]
-
-            # then correct extreme values
-            points[0]['lesser'] = visual_prop_values[0]
-            points[col_val_count - 1]['greater'] = visual_prop_values[-1]
-        elif prop_val_count - col_val_count == 0:
-            points = [{'value': col_val, 'lesser': prop_val, 'equal': prop_val, 'greater': prop_val} for
-                      col_val, prop_val in zip(table_column_values, visual_prop_values)]
-        else:
-            error = 'Error: table.column.values and visual.prop.values don\'t match up.'
-            sys.stderr.write(error)
-            raise CyError(error)
+    Returns:
+        list: list of dicts, one per spec, as returned by ``map_visual_property()``
 
-        visual_prop_map['points'] = points
+    Raises:
+        CyError: if network name or SUID doesn't exist, or any spec names an unknown visual property or column
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
-    return visual_prop_map
+    Examples:
+        >>> map_visual_properties_bulk([('node label', 'COMMON', 'p'), ('node shape', 'degree.layout', 'd', [1, 2], ['ellipse', 'rectangle'])])
+        [{'mappingType': 'passthrough', 'mappingColumn': 'COMMON', 'mappingColumnType': 'String', 'visualProperty': 'NODE_LABEL'}, {'mappingType': 'discrete', 'mappingColumn': 'degree.layout', 'mappingColumnType': 'Integer', 'visualProperty': 'NODE_SHAPE', 'map': [{'key': 1, 'value': 'ellipse'}, {'key': 2, 'value': 'rectangle'}]}]
+
+    See Also:
+        :meth:`map_visual_property`, :meth:`update_style_mappings_bulk`
+    """
+    for spec in specs:
+        _check_mapping_values(*spec[2:])
+    suid = networks.get_network_suid(network, base_url=base_url)
+    return [_build_visual_prop_map(*spec, suid=suid, base_url=base_url) for spec in specs]
 
 
 @cy_log
@@ -190,19 +201,69 @@ def update_style_mapping(style_name, mapping, base_url=DEFAULT_BASE_URL):
     """
     visual_prop_name = mapping['visualProperty']
 
-    # check if vp exists already
-    res = commands.cyrest_get('styles/' + style_name + '/mappings', base_url=base_url)
-    vp_list = [prop['visualProperty'] for prop in res]
-    exists = visual_prop_name in vp_list
+    # check if vp exists already ... ask Cytoscape, as the mapping may have been changed outside of py4cytoscape
+    invalidate_style_mappings_cache(style_name, base_url=base_url)
+    exists = _mapping_exists(style_name, visual_prop_name, base_url=base_url)
 
+    mappings_url = f'styles/{style_name}/mappings'
     if exists:
-        res = commands.cyrest_put('styles/' + style_name + '/mappings/' + visual_prop_name, body=[mapping],
-                                  base_url=base_url, require_json=False)
+        res = commands.cyrest_put(f'{mappings_url}/{visual_prop_name}', body=[mapping], base_url=base_url,
+                                  require_json=False)
     else:
-        res = commands.cyrest_post('styles/' + style_name + '/mappings', body=[mapping], base_url=base_url,
-                                   require_json=False)
-    time.sleep(
-        MODEL_PROPAGATION_SECS)  # wait for attributes to be applied ... it looks like Cytoscape returns before this is complete [Cytoscape BUG]
+        res = commands.cyrest_post(mappings_url, body=[mapping], base_url=base_url, require_json=False)
+    _wait_for_mappings(style_name, [mapping], base_url=base_url)
+    return res
+
+
+@cy_log
+def update_style_mappings_bulk(style_name, mappings, base_url=DEFAULT_BASE_URL):
+    """Update several visual property mappings in a style.
+
+    Same as calling ``update_style_mapping()`` for each mapping, except that all mappings not already in the style are
+    created by a single request, and waiting for Cytoscape to apply the mappings happens once, after all are sent.
+
+    Args:
+        style_name (str): name for style
+        mappings (list): visual property mappings, see ``map_visual_property()`` and ``map_visual_properties_bulk()``
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        str: ''
+
+    Raises:
+        CyError: if style doesn't exist
+        TypeError: if a mapping isn't a visual property mapping
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> update_style_mappings_bulk('galFiltered Style', map_visual_properties_bulk([('node label', 'name', 'p'), ('edge width', 'EdgeBetweenness', 'p')]))
+        ''
+
+    See Also:
+        :meth:`update_style_mapping`, :meth:`map_visual_properties_bulk`
+    """
+    # split mappings into those that replace an existing mapping and those that are new ... ask Cytoscape (once), as
+    # mappings may have been changed outside of py4cytoscape
+    invalidate_style_mappings_cache(style_name, base_url=base_url)
+    existing_mappings = []
+    new_mappings = []
+    for mapping in mappings:
+        if _mapping_exists(style_name, mapping['visualProperty'], base_url=base_url):
+            existing_mappings.append(mapping)
+        else:
+            new_mappings.append(mapping)
+
+    # CyREST replaces existing mappings one at a time, but can create any number of mappings at once
+    mappings_url = f'styles/{style_name}/mappings'
+    res = ''
+    for mapping in existing_mappings:
+        res = commands.cyrest_put(f'{mappings_url}/{mapping["visualProperty"]}', body=[mapping], base_url=base_url,
+                                  require_json=False)
+    if new_mappings:
+        res = commands.cyrest_post(mappings_url, body=new_mappings, base_url=base_url, require_json=False)
+    _wait_for_mappings(style_name, mappings, base_url=base_url)
     return res
 
 
@@ -229,14 +290,14 @@ def delete_style_mapping(style_name, visual_prop, base_url=DEFAULT_BASE_URL):
         >>> delete_style_mapping('galFiltered Style', 'node label')
         ''
     """
-    # check if vp exists already
-    res = commands.cyrest_get('styles/' + style_name + '/mappings', base_url=base_url)
-    vp_list = [prop['visualProperty'] for prop in res]
-    exists = visual_prop in vp_list
+    # check if vp exists already ... ask Cytoscape, as the mapping may have been changed outside of py4cytoscape
+    invalidate_style_mappings_cache(style_name, base_url=base_url)
+    exists = _mapping_exists(style_name, visual_prop, base_url=base_url)
 
     if exists:
-        res = commands.cyrest_delete('styles/' + style_name + '/mappings/' + visual_prop,
-                                     base_url=base_url, require_json=False)
+        invalidate_style_mappings_cache(style_name, base_url=base_url)
+        res = commands.cyrest_delete(f'styles/{style_name}/mappings/{visual_prop}', base_url=base_url,
+                                     require_json=False)
     else:
         res = None
     return res
@@ -273,11 +334,10 @@ def get_style_mapping(style_name, visual_prop, base_url=DEFAULT_BASE_URL):
         :meth:`map_visual_property`
     """
     # check if vp exists already
-    res = commands.cyrest_get('styles/' + style_name + '/mappings', base_url=base_url)
-    for prop in res:
-        if prop['visualProperty'] == visual_prop:
-            return prop
-    raise CyError('Property "' + visual_prop + '" does not exist in style "' + style_name + '"')
+    mappings_by_vp = _get_mappings_by_vp(style_name, base_url=base_url)
+    if visual_prop not in mappings_by_vp:
+        raise CyError(f'Property "{visual_prop}" does not exist in style "{style_name}"')
+    return copy.deepcopy(mappings_by_vp[visual_prop])
 
 
 # TODO: Are we missing a get_style_all_mappings here?? ... probably ... I'm adding one to help with testing ...
@@ -285,7 +345,9 @@ def get_style_mapping(style_name, visual_prop, base_url=DEFAULT_BASE_URL):
 def get_style_all_mappings(style_name, base_url=DEFAULT_BASE_URL):
     """Fetch all visual property mapping in a style.
 
-    The property mappings are the same as a dict created by ``map_visual_property()``.
+    The property mappings are the same as a dict created by ``map_visual_property()``. Mappings are remembered between
+    calls (and forgotten when py4cytoscape changes the style), so mappings changed outside of py4cytoscape (e.g., in
+    the Cytoscape GUI) may not be seen until a session is opened or closed.
 
     Args:
         style_name (str): name for style
@@ -308,7 +370,7 @@ def get_style_all_mappings(style_name, base_url=DEFAULT_BASE_URL):
     See Also:
         :meth:`map_visual_property`
     """
-    res = commands.cyrest_get('styles/' + style_name + '/mappings', base_url=base_url)
+    res = copy.deepcopy(list(_get_mappings_by_vp(style_name, base_url=base_url).values()))
     return res
 
 
@@ -353,9 +415,8 @@ def set_node_border_color_mapping(table_column, table_column_values=None, colors
         >>> set_node_border_color_mapping('ColorCol', mapping_type='p', default_color='#654321', style_name='galFiltered Style')
         ''
     """
-    for color in colors or []:
-        if is_not_hex_color(color):
-            return None  # TODO: Should we be throwing an exception?
+    if is_not_hex_colors(colors):
+        return None  # TODO: Should we be throwing an exception?
 
     # set default
     if default_color is not None:
@@ -390,7 +451,7 @@ def set_node_border_opacity_mapping(table_column, table_column_values=None, opac
         str or None: '' if successful or None if error
 
     Raises:
-        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network or mapping type
+        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network, mapping type or opacity
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -405,23 +466,9 @@ def set_node_border_opacity_mapping(table_column, table_column_values=None, opac
     #    if not table_column_exists(table_column, 'node', network=network, base_url=base_url):
     #        raise CyError('Table column does not exist. Please try again.')
 
-    for o in opacities or []:
-        if o < 0 or o > 255:
-            sys.stderr.write('Error: opacities must be between 0 and 255.')
-            return None
-
     # TODO: there is a set_node_border_opacity_default() ... shouldn't we be using that instead?
-    if default_opacity is not None:
-        if default_opacity < 0 or default_opacity > 255:
-            sys.stderr.write('Error: opacity must be between 0 and 255.')
-            return None
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'NODE_BORDER_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-
-    return _update_visual_property('NODE_BORDER_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                                   range_map=opacities, mapping_type=mapping_type, style_name=style_name,
-                                   network=network, base_url=base_url)
+    return _update_opacity_properties(['NODE_BORDER_TRANSPARENCY'], table_column, table_column_values, opacities,
+                                      mapping_type, default_opacity, style_name, network, base_url)
 
 
 @cy_log
@@ -504,9 +551,8 @@ def set_node_color_mapping(table_column, table_column_values=None, colors=None,
     #        raise CyError('Table column does not exist. Please try again.')
 
     # check if colors are formatted correctly
-    for color in colors or []:
-        if is_not_hex_color(color):
-            return None  # TODO: Should we be throwing an exception?
+    if is_not_hex_colors(colors):
+        return None  # TODO: Should we be throwing an exception?
 
     # set default
     if default_color is not None:
@@ -540,7 +586,7 @@ def set_node_combo_opacity_mapping(table_column, table_column_values=None, opaci
         str or None: '' if successful or None if error
 
     Raises:
-        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network or mapping type
+        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network, mapping type or opacity
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -551,36 +597,9 @@ def set_node_combo_opacity_mapping(table_column, table_column_values=None, opaci
         >>> set_node_combo_opacity_mapping('PassthruCol', mapping_type='p', default_opacity=225, style_name='galFiltered Style')
         ''
     """
-    for o in opacities or []:
-        if o < 0 or o > 255:
-            sys.stderr.write('Error: opacities must be between 0 and 255.')
-            return None
-
-    if default_opacity is not None:
-        if default_opacity < 0 or default_opacity > 255:
-            sys.stderr.write('Error: opacity must be between 0 and 255.')
-            return None
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'NODE_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'NODE_BORDER_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'NODE_LABEL_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-
-    # TODO: function results are ignored ... shouldn't we be capturing them?
-    _update_visual_property('NODE_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                            range_map=opacities, mapping_type=mapping_type, style_name=style_name, network=network,
-                            base_url=base_url)
-    _update_visual_property('NODE_BORDER_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                            range_map=opacities, mapping_type=mapping_type, style_name=style_name, network=network,
-                            base_url=base_url)
-    res = _update_visual_property('NODE_LABEL_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                                  range_map=opacities, mapping_type=mapping_type, style_name=style_name,
-                                  network=network, base_url=base_url)
-    return res
+    return _update_opacity_properties(['NODE_TRANSPARENCY', 'NODE_BORDER_TRANSPARENCY', 'NODE_LABEL_TRANSPARENCY'],
+                                      table_column, table_column_values, opacities, mapping_type, default_opacity,
+                                      style_name, network, base_url)
 
 
 @cy_log
@@ -605,7 +624,7 @@ def set_node_fill_opacity_mapping(table_column, table_column_values=None, opacit
         str or None: '' if successful or None if error
 
     Raises:
-        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network or mapping type
+        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network, mapping type or opacity
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -620,23 +639,9 @@ def set_node_fill_opacity_mapping(table_column, table_column_values=None, opacit
     #    if not table_column_exists(table_column, 'node', network=network, base_url=base_url):
     #        raise CyError('Table column does not exist. Please try again.')
 
-    for o in opacities or []:
-        if o < 0 or o > 255:
-            sys.stderr.write('Error: opacities must be between 0 and 255.')
-            return None
-
     # TODO: There is a set_node_fill_opacity_default() ... should that be called instead?
-    if default_opacity is not None:
-        if default_opacity < 0 or default_opacity > 255:
-            sys.stderr.write('Error: opacity must be between 0 and 255.')
-            return None
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'NODE_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-
-    return _update_visual_property('NODE_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                                   range_map=opacities, mapping_type=mapping_type, style_name=style_name,
-                                   network=network, base_url=base_url)
+    return _update_opacity_properties(['NODE_TRANSPARENCY'], table_column, table_column_values, opacities,
+                                      mapping_type, default_opacity, style_name, network, base_url)
 
 
 @cy_log
@@ -794,12 +799,13 @@ def set_node_label_mapping(table_column, style_name='default', network=None, bas
         ''
     """
     # TODO: The return value in the R code is None ... probably should be throwing an exception, which I'm doing
-    if not table_column_exists(table_column, 'node', network=network, base_url=base_url):
+    suid = networks.get_network_suid(network, base_url=base_url)
+    if not table_column_exists(table_column, 'node', network=suid, base_url=base_url):
         raise CyError('Table column does not exist. Please try again.')
 
     # TODO: Should there be the ability to set the node label default here? The call exists in styles_defaults
 
-    mvp = map_visual_property('NODE_LABEL', table_column, 'p', network=network, base_url=base_url)
+    mvp = _build_visual_prop_map('NODE_LABEL', table_column, 'p', suid=suid, base_url=base_url)
 
     res = update_style_mapping(style_name, mvp, base_url=base_url)
     return res
@@ -838,9 +844,8 @@ def set_node_label_color_mapping(table_column, table_column_values=None, colors=
         >>> set_node_label_color_mapping('ColorCol', mapping_type='p', default_color='#654321', style_name='galFiltered Style')
         ''
     """
-    for color in colors or []:
-        if is_not_hex_color(color):
-            return None  # TODO: Should we be throwing an exception?
+    if is_not_hex_colors(colors):
+        return None  # TODO: Should we be throwing an exception?
 
     # set default
     if default_color is not None:
@@ -874,7 +879,7 @@ def set_node_label_opacity_mapping(table_column, table_column_values=None, opaci
         str or None: '' if successful or None if error
 
     Raises:
-        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network or mapping type
+        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network, mapping type or opacity
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -889,23 +894,9 @@ def set_node_label_opacity_mapping(table_column, table_column_values=None, opaci
     #    if not table_column_exists(table_column, 'node', network=network, base_url=base_url):
     #        raise CyError('Table column does not exist. Please try again.')
 
-    for o in opacities or []:
-        if o < 0 or o > 255:
-            sys.stderr.write('Error: opacities must be between 0 and 255.')
-            return None
-
     # TODO: There is a set_node_label_opacity_default ... should that be called here?
-    if default_opacity is not None:
-        if default_opacity < 0 or default_opacity > 255:
-            sys.stderr.write('Error: opacity must be between 0 and 255.')
-            return None
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'NODE_LABEL_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-
-    return _update_visual_property('NODE_LABEL_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                                   range_map=opacities, mapping_type=mapping_type, style_name=style_name,
-                                   network=network, base_url=base_url)
+    return _update_opacity_properties(['NODE_LABEL_TRANSPARENCY'], table_column, table_column_values, opacities,
+                                      mapping_type, default_opacity, style_name, network, base_url)
 
 
 @cy_log
@@ -1014,12 +1005,13 @@ def set_node_tooltip_mapping(table_column, style_name='default', network=None, b
         ''
     """
     # TODO: The return value in the R code is None ... probably should be throwing an exception, which I'm doing
-    if not table_column_exists(table_column, 'node', network=network, base_url=base_url):
+    suid = networks.get_network_suid(network, base_url=base_url)
+    if not table_column_exists(table_column, 'node', network=suid, base_url=base_url):
         raise CyError('Table column does not exist. Please try again.')
 
     # TODO: There is a set_node_tooltip_default function ... should there be a default value here??
 
-    mvp = map_visual_property('NODE_TOOLTIP', table_column, 'p', network=network, base_url=base_url)
+    mvp = _build_visual_prop_map('NODE_TOOLTIP', table_column, 'p', suid=suid, base_url=base_url)
 
     res = update_style_mapping(style_name, mvp, base_url=base_url)
     return res
@@ -1078,9 +1070,8 @@ def set_node_width_mapping(table_column, table_column_values=None, widths=None,
 @cy_log
 def set_edge_color_mapping(table_column, table_column_values=None, colors=None, mapping_type='c', default_color=None,
                            style_name='default', network=None, base_url=DEFAULT_BASE_URL):
-    for color in colors or []:
-        if is_not_hex_color(color):
-            return None  # TODO: Should we be throwing an exception?
+    if is_not_hex_colors(colors):
+        return None  # TODO: Should we be throwing an exception?
 
     # set default
     if default_color is not None:
@@ -1210,12 +1201,13 @@ def set_edge_label_mapping(table_column, style_name='default', network=None, bas
         ''
     """
     # TODO: The return value in the R code is None ... probably should be throwing an exception, which I'm doing
-    if not table_column_exists(table_column, 'edge', network=network, base_url=base_url):
+    suid = networks.get_network_suid(network, base_url=base_url)
+    if not table_column_exists(table_column, 'edge', network=suid, base_url=base_url):
         raise CyError('Table column does not exist. Please try again.')
 
     # TODO: Should there be the ability to set the edge label default here? The call exists in styles_defaults
 
-    mvp = map_visual_property('EDGE_LABEL', table_column, 'p', network=network, base_url=base_url)
+    mvp = _build_visual_prop_map('EDGE_LABEL', table_column, 'p', suid=suid, base_url=base_url)
 
     res = update_style_mapping(style_name, mvp, base_url=base_url)
     return res
@@ -1254,9 +1246,8 @@ def set_edge_label_color_mapping(table_column, table_column_values=None, colors=
         >>> set_edge_label_color_mapping('ColorCol', mapping_type='p', default_color='#654321', style_name='galFiltered Style')
         ''
     """
-    for color in colors or []:
-        if is_not_hex_color(color):
-            return None  # TODO: Should we be throwing an exception?
+    if is_not_hex_colors(colors):
+        return None  # TODO: Should we be throwing an exception?
 
     # set default
     if default_color is not None:
@@ -1290,7 +1281,7 @@ def set_edge_label_opacity_mapping(table_column, table_column_values=None, opaci
         str or None: '' if successful or None if error
 
     Raises:
-        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network or mapping type
+        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network, mapping type or opacity
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -1305,23 +1296,9 @@ def set_edge_label_opacity_mapping(table_column, table_column_values=None, opaci
     #    if not table_column_exists(table_column, 'edge', network=network, base_url=base_url):
     #        raise CyError('Table column does not exist. Please try again.')
 
-    for o in opacities or []:
-        if o < 0 or o > 255:
-            sys.stderr.write('Error: opacities must be between 0 and 255.')
-            return None
-
     # TODO: There is a set_edge_label_opacity_default ... should that be called here?
-    if default_opacity is not None:
-        if default_opacity < 0 or default_opacity > 255:
-            sys.stderr.write('Error: opacity must be between 0 and 255.')
-            return None
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'EDGE_LABEL_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-
-    return _update_visual_property('EDGE_LABEL_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                                   range_map=opacities, mapping_type=mapping_type, style_name=style_name,
-                                   network=network, base_url=base_url, table='edge')
+    return _update_opacity_properties(['EDGE_LABEL_TRANSPARENCY'], table_column, table_column_values, opacities,
+                                      mapping_type, default_opacity, style_name, network, base_url, table='edge')
 
 
 @cy_log
@@ -1428,7 +1405,7 @@ def set_edge_opacity_mapping(table_column, table_column_values=None, opacities=N
         str or None: '' if successful or None if error
 
     Raises:
-        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network or mapping type
+        CyError: if table column doesn't exist, table column values doesn't match values list, or invalid style name, network, mapping type or opacity
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -1441,23 +1418,9 @@ def set_edge_opacity_mapping(table_column, table_column_values=None, opacities=N
     """
     # TODO: This code checks the table_column ... the R code does not
 
-    for o in opacities or []:
-        if o < 0 or o > 255:
-            sys.stderr.write('Error: opacities must be between 0 and 255.')
-            return None
-
     # TODO: There is a set_edge_opacity_default ... should that be called here?
-    if default_opacity is not None:
-        if default_opacity < 0 or default_opacity > 255:
-            sys.stderr.write('Error: opacity must be between 0 and 255.')
-            return None
-        style_defaults.set_visual_property_default(
-            {'visualProperty': 'EDGE_TRANSPARENCY', 'value': str(default_opacity)},
-            style_name=style_name, base_url=base_url)
-
-    return _update_visual_property('EDGE_TRANSPARENCY', table_column, table_column_values=table_column_values,
-                                   range_map=opacities, mapping_type=mapping_type, style_name=style_name,
-                                   network=network, base_url=base_url, table='edge')
+    return _update_opacity_properties(['EDGE_TRANSPARENCY'], table_column, table_column_values, opacities,
+                                      mapping_type, default_opacity, style_name, network, base_url, table='edge')
 
 
 # TODO: R spelled 'Mapping' as 'Maping' ... how to fix this??
@@ -1577,9 +1540,8 @@ def set_edge_target_arrow_color_mapping(table_column, table_column_values=None,
         >>> set_edge_target_arrow_color_mapping('ColorCol', mapping_type='p', default_color='#654321', style_name='galFiltered Style')
         ''
     """
-    for color in colors or []:
-        if is_not_hex_color(color):
-            return None  # TODO: Should we be throwing an exception?
+    if is_not_hex_colors(colors):
+        return None  # TODO: Should we be throwing an exception?
 
     # set default
     if default_color is not None:
@@ -1626,9 +1588,8 @@ def set_edge_source_arrow_color_mapping(table_column, table_column_values=None,
         >>> set_edge_source_arrow_color_mapping('ColorCol', mapping_type='p', default_color='#654321', style_name='galFiltered Style')
         ''
     """
-    for color in colors or []:
-        if is_not_hex_color(color):
-            return None  # TODO: Should we be throwing an exception?
+    if is_not_hex_colors(colors):
+        return None  # TODO: Should we be throwing an exception?
 
     # set default
     if default_color is not None:
@@ -1748,39 +1709,243 @@ def set_edge_tooltip_mapping(table_column, style_name='default', network=None, b
                                    network=network, base_url=base_url, table='edge', supported_mappings=['p'])
 
 
+# Verify that paired value lists can be mapped, so a mismatch is reported before any CyREST call is made. For a
+# continuous mapping, visual_prop_values may have two extra values (for values lesser and greater than the range).
+def _check_mapping_values(mapping_type, table_column_values=[], visual_prop_values=[]):
+    mapping_type_name = _MAPPING_TYPES.get(mapping_type, mapping_type)
+    if mapping_type_name == 'continuous':
+        values_match = len(visual_prop_values) - len(table_column_values) in (0, 2)
+    elif mapping_type_name == 'discrete':
+        values_match = len(visual_prop_values) == len(table_column_values)
+    else:
+        values_match = True
+    if not values_match:
+        error = 'Error: table.column.values and visual.prop.values don\'t match up.'
+        sys.stderr.write(error)
+        raise CyError(error)
+
+
+# Determine whether any opacity is outside of 0..255, using one numpy min/max pass instead of comparing each value
+def _opacities_out_of_range(opacities):
+    if opacities is None: return False
+    opacity_values = np.asarray(opacities)
+    return opacity_values.size > 0 and bool(opacity_values.min() < 0 or opacity_values.max() > 255)
+
+
+# Validate opacities and the default opacity, set the default (if any), and map the column to the opacity visual
+# properties. This is the body of each of the opacity setters.
+def _update_opacity_properties(visual_prop_names, table_column, table_column_values, opacities, mapping_type,
+                               default_opacity, style_name, network, base_url, table='node'):
+    if _opacities_out_of_range(opacities):
+        error = 'Error: opacities must be between 0 and 255.'
+        sys.stderr.write(error)
+        raise CyError(error)
+
+    if default_opacity is not None:
+        if default_opacity < 0 or default_opacity > 255:
+            error = 'Error: opacity must be between 0 and 255.'
+            sys.stderr.write(error)
+            raise CyError(error)
+        default_value = str(default_opacity)
+        style_defaults.set_visual_property_defaults(
+            [{'visualProperty': visual_prop_name, 'value': default_value} for visual_prop_name in visual_prop_names],
+            style_name=style_name, base_url=base_url)
+
+    return _update_visual_properties(visual_prop_names, table_column, table_column_values=table_column_values,
+                                     range_map=opacities, mapping_type=mapping_type, style_name=style_name,
+                                     network=network, base_url=base_url, table=table)
+
+
+# Create a visual property map (see map_visual_property()) for a network whose SUID is already known. Visual property
+# names and column types come from caches, so building many maps for one network costs few (if any) CyREST calls.
+def _build_visual_prop_map(visual_prop, table_column, mapping_type, table_column_values=[], visual_prop_values=[],
+                           suid=None, base_url=DEFAULT_BASE_URL):
+    # process mapping type
+    mapping_type_name = _MAPPING_TYPES.get(mapping_type, mapping_type)
+
+    # process visual property, including common alternatives for vp names :)
+    visual_prop_name = _WS_RE.sub('_', visual_prop).upper()
+    visual_prop_name = _PROPERTY_NAMES.get(visual_prop_name, visual_prop_name)
+
+    # check visual prop name ... if it's not in the cached list, make sure the cached list isn't out of date
+    if visual_prop_name not in _get_visual_property_names(base_url=base_url) and \
+            visual_prop_name not in _get_visual_property_names(base_url=base_url, refresh=True):
+        raise CyError(
+            'Could not find ' + visual_prop_name + '. Run get_visual_property_names() to retrieve property names.')
+
+    # check mapping column and get type ... if it's not in the cached columns, make sure they aren't out of date
+    table = _VP_PREFIX_TO_TABLE.get(visual_prop_name[:4])
+    if table is None:
+        table = 'default' + visual_prop_name.split('_')[0].lower()
+    columns = tables.cached_column_types(suid, table, base_url=base_url)
+    if table_column not in columns:
+        columns = tables.cached_column_types(suid, table, base_url=base_url, refresh=True)
+    table_column_type = columns.get(table_column)
+    if table_column_type is None:
+        raise CyError('Could not find ' + table_column + ' column in ' + table + ' table. Available columns: ' +
+                      ', '.join(sorted(columns)))
+
+    # construct visual property map
+    visual_prop_map = {'mappingType': mapping_type_name, 'mappingColumn': table_column,
+                       'mappingColumnType': table_column_type, 'visualProperty': visual_prop_name}
+    if mapping_type_name == 'discrete':
+        # CyREST reads each discrete entry as a {'key': ..., 'value': ...} object, so this list is already wire format
+        visual_prop_map['map'] = [{'key': col_val, 'value': prop_val} for col_val, prop_val in
+                                  zip(table_column_values, visual_prop_values)]
+    elif mapping_type_name == 'continuous':
+        # check for extra lesser and greater values (_check_mapping_values() verified the counts)
+        col_val_count = len(table_column_values)
+        has_extremes = len(visual_prop_values) - col_val_count == 2
+        matched_visual_prop_values = visual_prop_values[1:-1] if has_extremes else visual_prop_values
+
+        # build all points in one pass, using the extreme values (if any) for the first lesser and last greater
+        last_point = col_val_count - 1
+        visual_prop_map['points'] = [
+            {'value': col_val,
+             'lesser': visual_prop_values[0] if has_extremes and i == 0 else prop_val,
+             'equal': prop_val,
+             'greater': visual_prop_values[-1] if has_extremes and i == last_point else prop_val}
+            for i, (col_val, prop_val) in enumerate(zip(table_column_values, matched_visual_prop_values))]
+
+    return visual_prop_map
+
+
+# Return the set of visual property names, fetching it from Cytoscape only the first time. If the name being sought
+# isn't in the cached set, call again with refresh=True in case Cytoscape has learned new properties (e.g., from an app).
+def _get_visual_property_names(base_url=DEFAULT_BASE_URL, refresh=False):
+    names = None if refresh else _VP_NAMES_CACHE.get(base_url)
+    if names is None:
+        names = set(styles.get_visual_property_names(base_url=base_url))
+        _VP_NAMES_CACHE[base_url] = names
+    return names
+
+
+# Forget cached visual property names so the next lookup goes back to Cytoscape
+def _invalidate_vp_names_cache(base_url=None):
+    if base_url is None:
+        _VP_NAMES_CACHE.clear()
+    else:
+        _VP_NAMES_CACHE.pop(base_url, None)
+
+
+# Return a style's mappings as {visual property name: mapping}, fetching them from Cytoscape only if they aren't cached.
+# Keying by name lets existence checks and single-mapping lookups use a dict lookup instead of building and scanning a
+# list of names. Callers must not change the returned mappings.
+def _get_mappings_by_vp(style_name, base_url=DEFAULT_BASE_URL):
+    key = (base_url, style_name)
+    mappings_by_vp = _STYLE_MAPPINGS_CACHE.get(key)
+    if mappings_by_vp is None:
+        res = commands.cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
+        mappings_by_vp = {prop['visualProperty']: prop for prop in res}
+        _STYLE_MAPPINGS_CACHE[key] = mappings_by_vp
+    return mappings_by_vp
+
+
+# Determine whether a style has a mapping for a visual property, using the style's cached mappings. Callers that change
+# mappings based on the answer drop the style's cache entry first, so for them this still fetches the style's full
+# mapping list, as it always has. (Asking CyREST for the one mapping directly fails the same way for a missing mapping
+# and a missing style, and callers need to report a missing style as an error.)
+def _mapping_exists(style_name, visual_prop, base_url=DEFAULT_BASE_URL):
+    return visual_prop in _get_mappings_by_vp(style_name, base_url=base_url)
+
+
+# Forget cached mappings for a style, or for all styles if style_name is None
+def invalidate_style_mappings_cache(style_name=None, base_url=DEFAULT_BASE_URL):
+    if style_name is None:
+        _STYLE_MAPPINGS_CACHE.clear()
+    else:
+        _STYLE_MAPPINGS_CACHE.pop((base_url, style_name), None)
+
+
+# Wait for Cytoscape to report each of the mappings in the style ... it looks like Cytoscape returns before an update
+# is complete [Cytoscape BUG]. Instead of always sleeping for MODEL_PROPAGATION_SECS, poll with exponential backoff
+# (starting at MODEL_PROPAGATION_POLL_SECS) and give up once MODEL_PROPAGATION_SECS have passed. A mapping counts as
+# applied only when its discrete entries or continuous points match, so a mapping that replaces one with the same
+# column and entry count isn't mistaken for the old one. Each poll refreshes the style's cached mappings, and the last
+# snapshot is kept only if it shows every mapping applied.
+def _wait_for_mappings(style_name, mappings, base_url=DEFAULT_BASE_URL):
+    # CyREST echoes values in its own format (e.g., strings for numbers), so compare numbers as numbers and anything
+    # else as case-insensitive strings
+    def normalized(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return str(value).lower()
+
+    def entries(mapping):
+        return {(normalized(entry['key']), normalized(entry['value'])) for entry in mapping.get('map', [])}, \
+               {(normalized(point['value']), normalized(point['lesser']), normalized(point['equal']),
+                 normalized(point['greater'])) for point in mapping.get('points', [])}
+
+    def is_applied(mapping, mappings_by_vp):
+        applied = mappings_by_vp.get(mapping['visualProperty'])
+        return applied is not None and \
+               applied['mappingType'] == mapping['mappingType'] and \
+               applied['mappingColumn'] == mapping['mappingColumn'] and \
+               entries(applied) == entries(mapping)
+
+    if not mappings: return
+    deadline = time.monotonic() + MODEL_PROPAGATION_SECS
+    delay = MODEL_PROPAGATION_POLL_SECS
+    while True:
+        invalidate_style_mappings_cache(style_name, base_url=base_url)
+        mappings_by_vp = _get_mappings_by_vp(style_name, base_url=base_url)
+        if all(is_applied(mapping, mappings_by_vp) for mapping in mappings): return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            # don't let a snapshot that doesn't show the update answer later lookups
+            invalidate_style_mappings_cache(style_name, base_url=base_url)
+            return
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, MODEL_PROPAGATION_SECS)
+
+
 # Check table column, create the visual property map, and update Cytoscape's copy of the visual property
 # TODO: Clean up this function signature so it doesn't require table_column_values and range_map (if only 'p' is supported)
 def _update_visual_property(visual_prop_name, table_column, table_column_values=[], range_map=[], mapping_type='c',
                             style_name='default', network=None, base_url=DEFAULT_BASE_URL,
                             supported_mappings=['c', 'd', 'p'], table='node'):
-    if range_map is not None: range_map = [str(x) for x in range_map]  # CyREST requires strings
+    return _update_visual_properties([visual_prop_name], table_column, table_column_values=table_column_values,
+                                     range_map=range_map, mapping_type=mapping_type, style_name=style_name,
+                                     network=network, base_url=base_url, supported_mappings=supported_mappings,
+                                     table=table)
+
+
+# Same as _update_visual_property(), but maps the same column values to several visual properties at once. The network
+# is resolved once and the maps are sent as a batch (see update_style_mappings_bulk()), so new mappings cost one
+# CyREST request instead of one per visual property.
+def _update_visual_properties(visual_prop_names, table_column, table_column_values=[], range_map=[], mapping_type='c',
+                              style_name='default', network=None, base_url=DEFAULT_BASE_URL,
+                              supported_mappings=['c', 'd', 'p'], table='node'):
+    # CyREST requires strings. Note that numpy's astype(str) would format ints in a mixed list as floats (1 -> '1.0'),
+    # and list(map(str, ...)) measures slower than this comprehension on current CPython.
+    if range_map is not None: range_map = [str(x) for x in range_map]
 
     # TODO: Added because all mappings need to do this. R code should probably adopt this, too
-    if not table_column_exists(table_column, table, network=network, base_url=base_url):
+    suid = networks.get_network_suid(network, base_url=base_url)
+    if not table_column_exists(table_column, table, network=suid, base_url=base_url):
         raise CyError('Table column does not exist. Please try again.')
 
     # perform mapping
-    if mapping_type in ['continuous', 'c', 'interpolate']:
-        if 'c' in supported_mappings:
-            mvp = map_visual_property(visual_prop_name, table_column, 'c', table_column_values, range_map,
-                                      network=network, base_url=base_url)
-        else:
-            raise CyError('Continuous mapping of ' + visual_prop_name + ' values is not supported.')
-    elif mapping_type in ['discrete', 'd', 'lookup']:
-        if 'd' in supported_mappings:
-            mvp = map_visual_property(visual_prop_name, table_column, 'd', table_column_values, range_map,
-                                      network=network, base_url=base_url)
-        else:
-            raise CyError('Discrete mapping of ' + visual_prop_name + ' values is not supported.')
-    elif mapping_type in ['passthrough', 'p']:
-        if 'p' in supported_mappings:
-            mvp = map_visual_property(visual_prop_name, table_column, 'p', network=network, base_url=base_url)
-        else:
-            raise CyError('Passthrough mapping of ' + visual_prop_name + ' values is not supported.')
-    else:
+    mapping_code = _MAPPING_ALIASES.get(mapping_type)
+    if mapping_code is None:
         # TODO: Do we want to report this way?
         sys.stderr.write('mapping_type not recognized.')
         return None
-
-    res = update_style_mapping(style_name, mvp, base_url=base_url)
+    if mapping_code not in supported_mappings:
+        raise CyError(_MAPPING_TYPES[mapping_code].capitalize() + ' mapping of ' + ', '.join(visual_prop_names) +
+                      ' values is not supported.')
+
+    # a continuous or discrete mapping with no values (e.g., a call that only sets a default) has nothing to map, but
+    # the style must still exist ... fetching its (cached) mappings raises CyError if it doesn't
+    if mapping_code != 'p' and table_column_values is None and range_map is None:
+        _get_mappings_by_vp(style_name, base_url=base_url)
+        return ''
+
+    # all of the maps share the same values (which passthrough maps ignore), so they only need to be checked once
+    _check_mapping_values(mapping_code, table_column_values, range_map)
+    mvps = [_build_visual_prop_map(visual_prop_name, table_column, mapping_code, table_column_values, range_map,
+                                   suid=suid, base_url=base_url)
+            for visual_prop_name in visual_prop_names]
+    res = update_style_mappings_bulk(style_name, mvps, base_url=base_url)
     return res
@@ -31,6 +31,7 @@ import warnings
 # Internal module imports
 from . import commands
 from . import networks
+from . import style_mappings
 
 # Internal module convenience imports
 from .exceptions import CyError
@@ -75,6 +76,7 @@ def copy_visual_style(from_style, to_style, base_url=DEFAULT_BASE_URL):
 
     # and send it to Cytoscape as a new style with a new name
     res = commands.cyrest_post('styles', body=style_from_to, base_url=base_url)
+    style_mappings.invalidate_style_mappings_cache(to_style, base_url=base_url)
 
     # get and update dependencies as well
     res = commands.cyrest_get('styles/' + from_style + '/dependencies', base_url=base_url)
@@ -124,6 +126,7 @@ def create_visual_style(style_name, defaults=None, mappings=None, base_url=DEFAU
         style_def = [{'visualProperty': key, 'value': val}  for key, val in defaults.items()]
     style = {'title': style_name, 'defaults': style_def, 'mappings': mappings}
     res = commands.cyrest_post('styles', body=style, base_url=base_url)
+    style_mappings.invalidate_style_mappings_cache(style_name, base_url=base_url)
     return res
 
 @cy_log
@@ -148,6 +151,7 @@ def delete_visual_style(style_name, base_url=DEFAULT_BASE_URL):
         ''
     """
     res = commands.cyrest_delete('styles/' + style_name, base_url=base_url, require_json=False)
+    style_mappings.invalidate_style_mappings_cache(style_name, base_url=base_url)
     return res
 
 @cy_log
@@ -228,6 +232,7 @@ def import_visual_styles(filename="styles.xml", base_url=DEFAULT_BASE_URL):
     filename = os.path.abspath(filename)
 
     res = commands.commands_post('vizmap load file file="' + filename + '"', base_url=base_url)
+    style_mappings.invalidate_style_mappings_cache()
     return res
 
 @cy_log
@@ -33,6 +33,11 @@ from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
 from .exceptions import CyError
 
+# Column types of network tables, as {(base_url, network SUID, table): {column name: column type}}. Functions in this
+# module that change a table's columns drop the entries for that network, and opening or closing a session drops all
+# entries.
+_COLUMNS_CACHE = {}
+
 
 def __init__(self):
     pass
@@ -75,6 +80,7 @@ def delete_table_column(column, table='node', namespace='default', network=None,
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.cyrest_delete('networks/' + str(net_suid) + '/tables/' + namespace + table + '/columns/' + column,
                                  base_url=base_url, require_json=False)
+    invalidate_column_types_cache(net_suid)
     return res
 
 
@@ -434,6 +440,7 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
     res = commands.cyrest_put('networks/' + str(net_suid) + '/tables/' + tbl,
                               body={'key': table_key_column, 'dataKey': data_key_column, 'data': data_list},
                               require_json=False, base_url=base_url)
+    invalidate_column_types_cache(net_suid)
 
     return 'Success: Data loaded in ' + tbl + ' table'
 
@@ -495,6 +502,7 @@ def map_table_column(column, species, map_from, map_to, force_single=True, table
 
     res_map = commands.commands_post(
         'idmapper map column columnName="' + column + '" forceSingle="' + fs + '" mapFrom="' + map_from + '" mapTo="' + map_to + '" species="' + species + '" table="' + tbl + '"')  # {'new column': 'SGD '}
+    invalidate_column_types_cache(net_suid)
     if res_map['new column'] == 'null ': raise CyError('Error:mapIdentifiers failed')
     # TODO: Do we really mean to throw this result away?? R does ... if the 'new column' value returns null, something went wrong ... I added check
 
@@ -537,9 +545,31 @@ def rename_table_column(column, new_name, table='node', namespace='default', net
     res = commands.cyrest_put('networks/' + str(net_suid) + '/tables/' + namespace + table + '/columns',
                               body={'oldName': column, 'newName': new_name},
                               base_url=base_url, require_json=False)
+    invalidate_column_types_cache(net_suid)
     return res
 
 
+# Return {column name: column type} for a fully qualified table (e.g., 'defaultnode'), fetching it from Cytoscape only
+# if it isn't already cached or if refresh=True
+def cached_column_types(suid, table, base_url=DEFAULT_BASE_URL, refresh=False):
+    key = (base_url, suid, table)
+    columns = None if refresh else _COLUMNS_CACHE.get(key)
+    if columns is None:
+        res = commands.cyrest_get(f'networks/{suid}/tables/{table}/columns', base_url=base_url)
+        columns = {col['name']: col['type'] for col in res}
+        _COLUMNS_CACHE[key] = columns
+    return columns
+
+
+# Forget cached column types for a network, or for all networks if suid is None
+def invalidate_column_types_cache(suid=None):
+    if suid is None:
+        _COLUMNS_CACHE.clear()
+    else:
+        for key in [key for key in _COLUMNS_CACHE if key[1] == suid]:
+            del _COLUMNS_CACHE[key]
+
+
 # TODO: Check to see if this is needed in RCy3
 def _nan_to_none(original_df, attr_dict_list):
     # convert missing numbers from 'nan' to None, which will cause the JSON converter to properly emit null
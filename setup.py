@@ -28,6 +28,9 @@ setuptools.setup(
         'python-igraph': (
             'python-igraph'
         ),
+        'orjson': (
+            'orjson'
+        ),
     },
     classifiers=[
         'Intended Audience :: Science/Research',
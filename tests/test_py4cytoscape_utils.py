@@ -39,6 +39,15 @@ class Py4cytoscapeUtilsTests(unittest.TestCase):
         self.assertEqual(build_url(DEFAULT_BASE_URL), DEFAULT_BASE_URL)
         self.assertEqual(build_url(DEFAULT_BASE_URL, 'command test'), DEFAULT_BASE_URL + '/command%20test')
 
+    @print_entry_exit
+    def test_is_not_hex_colors(self):
+        self.assertFalse(is_not_hex_colors(None))
+        self.assertFalse(is_not_hex_colors([]))
+        self.assertFalse(is_not_hex_colors(['#FF0000', '#00ff00', '#0000FF']))
+        self.assertTrue(is_not_hex_colors(['#FF0000', 'FF00000']))
+        self.assertTrue(is_not_hex_colors(['#FF0000', '#FF00']))
+        self.assertTrue(is_not_hex_colors(['#FF0000', '#FF00000']))
+
     @print_entry_exit
     def test_node_suid_to_node_name(self):
         # Initialization
@@ -70,6 +70,26 @@ class StyleDefaultsTests(unittest.TestCase):
         self.assertEqual(update_style_defaults(defaults={'bogusProperty': '0'}, style_name=self._TEST_STYLE), '')
         # TODO: Do we want a silent failure for bogus properties?
 
+    @print_entry_exit
+    def test_set_visual_property_defaults(self):
+        # Initialization
+        load_test_session()
+
+        orig_edge_width = get_visual_property_default('EDGE_WIDTH', style_name=self._TEST_STYLE)
+        orig_node_shape = get_visual_property_default('NODE_SHAPE', style_name=self._TEST_STYLE)
+
+        self.assertEqual(set_visual_property_defaults([], style_name=self._TEST_STYLE), '')
+        self.assertEqual(set_visual_property_defaults([{'visualProperty': 'EDGE_WIDTH', 'value': '50.0'},
+                                                       {'visualProperty': 'NODE_SHAPE', 'value': 'OCTAGON'}],
+                                                      style_name=self._TEST_STYLE), '')
+
+        self._check_getter_value_default('EDGE_WIDTH', orig_edge_width, 50.0)
+        self._check_getter_value_default('NODE_SHAPE', orig_node_shape, 'OCTAGON')
+
+        # Verify that an invalid style name is caught
+        self.assertRaises(CyError, set_visual_property_defaults,
+                          [{'visualProperty': 'EDGE_WIDTH', 'value': '50.0'}], style_name='bogusStyle')
+
     @print_entry_exit
     def test_get_set_visual_property_default(self):
         # Initialization
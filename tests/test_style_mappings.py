@@ -94,6 +94,30 @@ class StyleMappingsTests(unittest.TestCase):
         self.assertRaises(CyError, map_visual_property, 'edge width', 'bogus column', 'p')
         self.assertRaises(CyError, map_visual_property, 'node fill color', 'gal1RGexp', 'c',
                           [-10.0, -2.426, 0.0, 2.058], ['#0066CC', '#FFFFFF', '#FFFF00'])
+        self.assertRaises(CyError, map_visual_property, 'node shape', 'degree.layout', 'd', [1, 2], ['ellipse'])
+
+    @print_entry_exit
+    def test_map_visual_properties_bulk(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that each spec produces the same map as map_visual_property() does
+        specs = [('node fill color', 'gal1RGexp', 'c', [-2.426, 0.0, 2.058], ['#0066CC', '#FFFFFF', '#FFFF00']),
+                 ('node shape', 'degree.layout', 'd', [1, 2], ['ellipse', 'rectangle']),
+                 ('node label', 'COMMON', 'p'),
+                 ('edge width', 'EdgeBetweenness', 'p')]
+        res = map_visual_properties_bulk(specs)
+        self.assertEqual(len(res), len(specs))
+        for bulk_prop, spec in zip(res, specs):
+            self.assertDictEqual(bulk_prop, map_visual_property(*spec))
+
+        # Verify that no specs produce no maps
+        self.assertListEqual(map_visual_properties_bulk([]), [])
+
+        # Verify that unknown property, column or network are caught
+        self.assertRaises(CyError, map_visual_properties_bulk, [('bogus property', 'EdgeBetweenness', 'p')])
+        self.assertRaises(CyError, map_visual_properties_bulk, [('edge width', 'bogus column', 'p')])
+        self.assertRaises(CyError, map_visual_properties_bulk, specs, network='bogus network')
 
     @print_entry_exit
     def test_get_style_all_mappings(self):
@@ -191,6 +215,28 @@ class StyleMappingsTests(unittest.TestCase):
         self.assertRaises(CyError, update_style_mapping, 'bogus style', new_prop)
         self.assertRaises(TypeError, update_style_mapping, self._GAL_FILTERED_STYLE, 'bogus property')
 
+    @print_entry_exit
+    def test_update_style_mappings_bulk(self):
+        # Initialization
+        load_test_session()
+
+        # Replace the existing NODE_LABEL property and set EDGE_LABEL, and verify that both were set
+        new_props = map_visual_properties_bulk([('NODE_LABEL', 'name', 'p'), ('EDGE_LABEL', 'interaction', 'p')])
+        self.assertEqual(update_style_mappings_bulk(self._GAL_FILTERED_STYLE, new_props), '')
+        self._check_property(get_style_mapping(self._GAL_FILTERED_STYLE, 'NODE_LABEL'), 'NODE_LABEL', 'name',
+                             'String', 'passthrough')
+        self._check_property(get_style_mapping(self._GAL_FILTERED_STYLE, 'EDGE_LABEL'), 'EDGE_LABEL', 'interaction',
+                             'String', 'passthrough')
+
+        # Verify that updating with no mappings changes nothing
+        all_props = get_style_all_mappings(self._GAL_FILTERED_STYLE)
+        self.assertEqual(update_style_mappings_bulk(self._GAL_FILTERED_STYLE, []), '')
+        self.assertListEqual(get_style_all_mappings(self._GAL_FILTERED_STYLE), all_props)
+
+        # Verify that an invalid style or property is caught
+        self.assertRaises(CyError, update_style_mappings_bulk, 'bogus style', new_props)
+        self.assertRaises(TypeError, update_style_mappings_bulk, self._GAL_FILTERED_STYLE, ['bogus property'])
+
     @print_entry_exit
     def test_set_node_border_color_mapping(self):
         _NEW_DEFAULT = '#654321'
@@ -225,7 +271,7 @@ class StyleMappingsTests(unittest.TestCase):
                                        # 'compare_tolerance_percent': 0,
                                        'cont_test_params': {'opacities': [50, 100]},
                                        # 'cont_no_map_params': {'mapping_type': 'c'},
-                                       'cont_bad_map_params': {'opacities': [550, 100]},
+                                       'cont_bad_map_exception_params': {'opacities': [550, 100]},
                                        'cont_short_map_params': {'opacities': [50]},
                                        'disc_test_params': {'opacities': [50, 100], 'mapping_type': 'd'},
                                        # 'disc_no_map_params': {'mapping_type': 'd'},
@@ -279,6 +325,13 @@ class StyleMappingsTests(unittest.TestCase):
                                        'exception_check_params': {'mapping_type': 'p'},
                                        })
 
+        # Verify that setting only a default leaves the existing mapping alone
+        orig_mapping = get_style_mapping('galFiltered Style', 'NODE_FILL_COLOR')
+        self.assertEqual(set_node_color_mapping('AverageShortestPathLength', default_color='#FF0000',
+                                                style_name='galFiltered Style'), '')
+        self.assertEqual(get_visual_property_default('NODE_FILL_COLOR', style_name='galFiltered Style'), '#FF0000')
+        self.assertDictEqual(get_style_mapping('galFiltered Style', 'NODE_FILL_COLOR'), orig_mapping)
+
     @print_entry_exit
     def test_set_node_combo_opacity_mapping(self):
         _NEW_DEFAULT = 225
@@ -292,7 +345,7 @@ class StyleMappingsTests(unittest.TestCase):
                                        'set_default': 'p',
                                        'cont_test_params': {'opacities': [50, 100]},
                                        # 'cont_no_map_params': {'mapping_type': 'c'},
-                                       'cont_bad_map_params': {'opacities': [550, 100]},
+                                       'cont_bad_map_exception_params': {'opacities': [550, 100]},
                                        'cont_short_map_params': {'opacities': [50]},
                                        'disc_test_params': {'opacities': [50, 100], 'mapping_type': 'd'},
                                        # 'disc_no_map_params': {'mapping_type': 'd'},
@@ -314,7 +367,7 @@ class StyleMappingsTests(unittest.TestCase):
                                        # 'compare_tolerance_percent': 0,
                                        'cont_test_params': {'opacities': [50, 100]},
                                        # 'cont_no_map_params': {'mapping_type': 'c'},
-                                       'cont_bad_map_params': {'opacities': [550, 100]},
+                                       'cont_bad_map_exception_params': {'opacities': [550, 100]},
                                        'cont_short_map_params': {'opacities': [50]},
                                        'disc_test_params': {'opacities': [50, 100], 'mapping_type': 'd'},
                                        # 'disc_no_map_params': {'mapping_type': 'd'},
@@ -447,7 +500,7 @@ class StyleMappingsTests(unittest.TestCase):
                                        # 'compare_tolerance_percent': 0,
                                        'cont_test_params': {'opacities': [50, 100]},
                                        # 'cont_no_map_params': {'mapping_type': 'c'},
-                                       'cont_bad_map_params': {'opacities': [550, 100]},
+                                       'cont_bad_map_exception_params': {'opacities': [550, 100]},
                                        'cont_short_map_params': {'opacities': [50]},
                                        'disc_test_params': {'opacities': [50, 100], 'mapping_type': 'd'},
                                        # 'disc_no_map_params': {'mapping_type': 'd'},
@@ -675,7 +728,7 @@ class StyleMappingsTests(unittest.TestCase):
                                        # 'compare_tolerance_percent': 0,
                                        'cont_test_params': {'opacities': [50, 100]},
                                        # 'cont_no_map_params': {'mapping_type': 'c'},
-                                       'cont_bad_map_params': {'opacities': [550, 100]},
+                                       'cont_bad_map_exception_params': {'opacities': [550, 100]},
                                        'cont_short_map_params': {'opacities': [50]},
                                        'disc_test_params': {'opacities': [150, 200], 'mapping_type': 'd'},
                                        # 'disc_no_map_params': {'mapping_type': 'd'},
@@ -742,7 +795,7 @@ class StyleMappingsTests(unittest.TestCase):
                                        # 'compare_tolerance_percent': 0,
                                        'cont_test_params': {'opacities': [50, 100]},
                                        # 'cont_no_map_params': {'mapping_type': 'c'},
-                                       'cont_bad_map_params': {'opacities': [550, 100]},
+                                       'cont_bad_map_exception_params': {'opacities': [550, 100]},
                                        'cont_short_map_params': {'opacities': [50]},
                                        'disc_test_params': {'opacities': [75, 100], 'mapping_type': 'd'},
                                        # 'disc_no_map_params': {'mapping_type': 'd'},
@@ -1014,6 +1067,9 @@ class StyleMappingsTests(unittest.TestCase):
             self.assertIsNone(
                 prop_func(style_name=_TEST_STYLE, table_column=_CONT_COL, table_column_values=_CONT_VAL_RANGE,
                           **profile['cont_bad_map_params']), msg='Check bad continuous value')
+        if 'cont_bad_map_exception_params' in profile:
+            self.assertRaises(CyError, prop_func, style_name=_TEST_STYLE, table_column=_CONT_COL,
+                              table_column_values=_CONT_VAL_RANGE, **profile['cont_bad_map_exception_params'])
 
         # Verify that a bad mapping type is caught
         if 'invalid_map_params' in profile:
@@ -1056,6 +1112,8 @@ class StyleMappingsTests(unittest.TestCase):
     #       result in an error. e.g., {'mapping_type': 'c'}
     # 'cont_bad_map_params': parameter to pass for verifying that parameter values are checked when 'c' is available.
     #       Should result in an error. e.g., {'colors': ['#FBE72', '#440256']},
+    # 'cont_bad_map_exception_params': same as 'cont_bad_map_params', but for properties whose values are checked by
+    #       raising a CyError. e.g., {'opacities': [550, 100]},
     # 'cont_short_map_params': parameter to pass for verifying that parameter values are checked when 'c' is available.
     #       Should result in an error. e.g., {'colors': ['#440256']} when two table_column_values are provided.
     # 'disc_test_params': parameter to pass for a 'd' mapping when 'd' is available ... usually includes the list
@@ -1146,6 +1204,9 @@ class StyleMappingsTests(unittest.TestCase):
                 prop_func(style_name=_TEST_STYLE, table_column=_CONT_COL, table_column_values=_CONT_VAL_RANGE,
                           **profile['cont_bad_map_params']),
                 msg='Check bad continuous value')
+        if 'cont_bad_map_exception_params' in profile:
+            self.assertRaises(CyError, prop_func, style_name=_TEST_STYLE, table_column=_CONT_COL,
+                              table_column_values=_CONT_VAL_RANGE, **profile['cont_bad_map_exception_params'])
 
         # Verify that a bad mapping type is caught
         if 'invalid_map_params' in profile: